@@ -1,6 +1,7 @@
 from pathlib import Path
 import os
-import shutil
+
+import pyarrow.parquet as pq
 
 ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = Path(os.getenv("DATA_DIR", str(ROOT / "data"))).resolve()
@@ -11,11 +12,14 @@ OWNER_REPO = "pandas-dev__pandas"  # adapte si besoin
 def main():
     DOCS_DATA.mkdir(parents=True, exist_ok=True)
 
-    src_global = DATA_DIR / "gold" / OWNER_REPO / "kpi_monthly_global.csv"
+    src_global = DATA_DIR / "gold" / OWNER_REPO / "kpi_monthly_global"
     if not src_global.exists():
         raise FileNotFoundError(f"Missing: {src_global} (run gold first)")
 
-    shutil.copy2(src_global, DOCS_DATA / "kpi_monthly_global.csv")
+    # gold only emits Parquet (partitioned by month); render the docs CSV here
+    df = pq.read_table(src_global).to_pandas().sort_values("month")
+    df = df[["month", *[c for c in df.columns if c != "month"]]]
+    df.to_csv(DOCS_DATA / "kpi_monthly_global.csv", index=False, encoding="utf-8")
     print("OK: exported docs/data/kpi_monthly_global.csv")
 
 if __name__ == "__main__":
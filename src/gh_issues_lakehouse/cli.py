@@ -1,28 +1,32 @@
 import argparse
+import importlib
+
+from dotenv import load_dotenv
+
+# Subcommand -> (module, function): only the module for the chosen step gets imported
+DISPATCH = {
+    "ingest": ("gh_issues_lakehouse.ingest", "run_ingest"),
+    "silver": ("gh_issues_lakehouse.silver", "run_silver"),
+    "gold": ("gh_issues_lakehouse.gold", "run_gold"),
+    "demo": ("gh_issues_lakehouse.demo", "run_demo"),
+}
 
 def main():
+    # Load .env once here; the step modules read plain os.environ
+    load_dotenv()
+
     parser = argparse.ArgumentParser(prog="gh-issues-lakehouse")
 
     parser.add_argument(
         "command",
-        choices=["ingest", "silver", "gold", "demo"],
+        choices=sorted(DISPATCH),
         help="Which step to run"
     )
 
     args = parser.parse_args()
 
-    if args.command == "ingest":
-        from gh_issues_lakehouse.ingest import run_ingest
-        run_ingest()
-    elif args.command == "silver":
-        from gh_issues_lakehouse.silver import run_silver
-        run_silver()
-    elif args.command == "demo":
-        from gh_issues_lakehouse.demo import run_demo
-        run_demo()
-    else:
-        from gh_issues_lakehouse.gold import run_gold
-        run_gold()
+    module, func = DISPATCH[args.command]
+    getattr(importlib.import_module(module), func)()
 
     print(f"Command selected: {args.command}")
 
@@ -1,17 +1,31 @@
 import os
 from pathlib import Path
 
-import pandas as pd
-from dotenv import load_dotenv
+import pyarrow.parquet as pq
 
 def run_demo():
-    load_dotenv()
-    data_dir = Path(os.getenv("DATA_DIR", "./data")).resolve()
+    # .env is loaded once by the CLI entrypoint; only DATA_DIR matters here
+    data_dir = Path(os.environ.get("DATA_DIR", "./data")).resolve()
 
-    path = data_dir / "gold" / "pandas-dev__pandas" / "kpi_monthly_global.csv"
-    if not path.exists():
+    root = data_dir / "gold" / "pandas-dev__pandas" / "kpi_monthly_global"
+    if not root.exists():
         raise FileNotFoundError("Gold output not found. Run: python -m gh_issues_lakehouse gold")
 
-    df = pd.read_csv(path)
+    # The global KPI dataset is partitioned by month: list the partition dirs
+    # and read only the last 5 months instead of the whole table
+    months = sorted(
+        e.name.split("=", 1)[1]
+        for e in os.scandir(root)
+        if e.is_dir() and e.name.startswith("month=")
+    )
+    if not months:
+        raise FileNotFoundError(f"No month partitions under {root}")
+
+    cutoff = months[-5:][0]
+    tbl = pq.read_table(root, filters=[("month", ">=", cutoff)])
+
+    df = tbl.to_pandas().sort_values("month")
+    df = df[["month", *[c for c in df.columns if c != "month"]]]
+
     print("[demo] Showing last 5 months:")
     print(df.tail(5).to_string(index=False))
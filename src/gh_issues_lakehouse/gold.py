@@ -1,10 +1,22 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import yaml
 from dotenv import load_dotenv
 
+try:
+    import polars as pl
+except ImportError:  # polars is optional: we fall back to the pandas pipeline
+    pl = None
+
+# libyaml-backed loader when available (3-5x faster than the pure-Python one)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def _ensure_datetime(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
     for c in cols:
@@ -13,154 +25,325 @@ def _ensure_datetime(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
     return df
 
 
-def _month_str(dt_series: pd.Series) -> pd.Series:
-    # "2025-01" format
-    return dt_series.dt.to_period("M").astype(str)
+def _month_key(dt_series: pd.Series) -> pd.Series:
+    # int32 YYYYMM key: groups/sorts/merges on 4-byte ints instead of strings
+    return (dt_series.dt.year * 100 + dt_series.dt.month).astype("int32")
 
 
-def run_gold(config_path: str = "config.yml") -> None:
-    load_dotenv()
-    data_dir = Path(os.getenv("DATA_DIR", "./data")).resolve()
+def _format_month(key: pd.Series) -> pd.Series:
+    # YYYYMM int -> "2025-01", applied once right before saving
+    k = key.astype("int64")
+    return (k // 100).astype(str).str.zfill(4) + "-" + (k % 100).astype(str).str.zfill(2)
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        cfg = yaml.safe_load(f)
 
-    repos = cfg["source"]["repos"]
-    rules = cfg.get("rules", {})
+def _write_parquet(df: pd.DataFrame, path: Path) -> None:
+    # zstd + dictionary encoding: the month/component/tier columns are highly
+    # repetitive, so this shrinks the files considerably vs the defaults
+    tbl = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(tbl, path, compression="zstd", use_dictionary=True, data_page_size=1 << 20)
 
-    # Buckets (stats de temps)
-    buckets = rules.get("time_buckets_hours", [24, 72, 168, 336])
 
-    for r in repos:
-        owner, repo = r["owner"], r["repo"]
+def _save_outputs(kpi: pd.DataFrame, global_kpi: pd.DataFrame, gold_dir: Path, emit_csv: bool = False) -> None:
+    out_comp_parquet = gold_dir / "kpi_monthly_component_tier.parquet"
+    out_global_dataset = gold_dir / "kpi_monthly_global"
 
-        silver_dir = data_dir / "silver" / f"{owner}__{repo}"
-        gold_dir = data_dir / "gold" / f"{owner}__{repo}"
-        gold_dir.mkdir(parents=True, exist_ok=True)
+    _write_parquet(kpi, out_comp_parquet)
 
-        silver_parquet = silver_dir / "issues_silver.parquet"
-        silver_csv = silver_dir / "issues_silver.csv"
+    # The global table is Hive-partitioned on month: consumers that only want
+    # recent months (demo, docs export) read just those partition files
+    pq.write_to_dataset(
+        pa.Table.from_pandas(global_kpi, preserve_index=False),
+        root_path=str(out_global_dataset),
+        partition_cols=["month"],
+        compression="zstd",
+        existing_data_behavior="delete_matching",
+    )
 
-        if silver_parquet.exists():
-            df = pd.read_parquet(silver_parquet)
-        elif silver_csv.exists():
-            df = pd.read_csv(silver_csv)
-        else:
-            raise FileNotFoundError(f"No silver file found in {silver_dir}")
+    # CSV is redundant with Parquet for analytics; only emit it when asked
+    # (outputs.emit_csv in config.yml). docs/ CSV comes from export_pages_data.py.
+    if emit_csv:
+        kpi.to_csv(gold_dir / "kpi_monthly_component_tier.csv", index=False, encoding="utf-8")
+        global_kpi.to_csv(gold_dir / "kpi_monthly_global.csv", index=False, encoding="utf-8")
 
-        df = _ensure_datetime(df, ["created_at", "closed_at", "updated_at"])
+    print(f"[gold] saved -> {out_comp_parquet}")
+    print(f"[gold] saved -> {out_global_dataset}/ (partitioned by month)")
+    print(f"[gold] months={global_kpi['month'].nunique()} | created={int(global_kpi['created_count'].sum())} | closed={int(global_kpi['closed_count'].sum())}")
 
-        # Focus: defect-like tickets only (adapté GitHub)
-        df_def = df[df["ticket_kind"] == "defect"].copy()
 
-        if df_def.empty:
-            print(f"[gold] No defect tickets found for {owner}/{repo}.")
-            continue
+def _run_gold_repo_polars(owner: str, repo: str, silver_parquet: Path, gold_dir: Path, buckets: list, emit_csv: bool = False) -> None:
+    """Lazy Polars version of the gold pipeline: one optimized query plan,
+    parallel group_by, streaming collect (low peak memory)."""
+    keys = ["month", "component", "priority_tier"]
 
-        # --- CREATED (flow in) ---
-        created = df_def.copy()
-        created = created[created["created_at"].notna()]
-        created["month"] = _month_str(created["created_at"])
+    lf = pl.scan_parquet(silver_parquet).filter(pl.col("ticket_kind") == "defect")
 
-        created_kpi = (
-            created.groupby(["month", "component", "priority_tier"], dropna=False)
-            .agg(created_count=("issue_id", "count"))
-            .reset_index()
-        )
+    if lf.select(pl.len()).collect().item() == 0:
+        print(f"[gold] No defect tickets found for {owner}/{repo}.")
+        return
 
-        # --- CLOSED (flow out + resolution stats) ---
-        closed = df_def.copy()
-        closed = closed[closed["closed_at"].notna() & closed["created_at"].notna()]
-        closed["month"] = _month_str(closed["closed_at"])
-
-        # resolution_hours: si déjà calculé en Silver, on le garde ; sinon on le calcule
-        if "resolution_hours" not in closed.columns or closed["resolution_hours"].isna().all():
-            closed["resolution_hours"] = (closed["closed_at"] - closed["created_at"]).dt.total_seconds() / 3600.0
-        else:
-            # au cas où c'est string
-            closed["resolution_hours"] = pd.to_numeric(closed["resolution_hours"], errors="coerce")
-
-        def p90(x):
-            return x.quantile(0.90)
-
-        closed_kpi = (
-            closed.groupby(["month", "component", "priority_tier"], dropna=False)
-            .agg(
-                closed_count=("issue_id", "count"),
-                avg_resolution_hours=("resolution_hours", "mean"),
-                median_resolution_hours=("resolution_hours", "median"),
-                p90_resolution_hours=("resolution_hours", p90),
-            )
-            .reset_index()
-        )
+    # resolution_hours: keep the silver value when present, else derive it
+    if "resolution_hours" in lf.collect_schema().names():
+        res_hours = pl.col("resolution_hours").cast(pl.Float64, strict=False)
+    else:
+        res_hours = (pl.col("closed_at") - pl.col("created_at")).dt.total_seconds() / 3600.0
+
+    # --- CREATED (flow in) ---
+    created_kpi = (
+        lf.filter(pl.col("created_at").is_not_null())
+        .with_columns(pl.col("created_at").dt.strftime("%Y-%m").alias("month"))
+        .group_by(keys)
+        .agg(pl.len().alias("created_count"))
+    )
 
-        # Buckets: share closed within X hours
-        for b in buckets:
-            col = f"share_closed_within_{int(b)}h"
-            tmp = closed.copy()
-            tmp[col] = (tmp["resolution_hours"] <= float(b))
-            bucket_kpi = (
-                tmp.groupby(["month", "component", "priority_tier"], dropna=False)[col]
-                .mean()
-                .reset_index()
-            )
-            closed_kpi = closed_kpi.merge(bucket_kpi, on=["month", "component", "priority_tier"], how="left")
-
-        # --- MERGE created + closed into one monthly table ---
-        kpi = created_kpi.merge(closed_kpi, on=["month", "component", "priority_tier"], how="outer")
-
-        # Fill counts with 0
-        kpi["created_count"] = kpi["created_count"].fillna(0).astype(int)
-        kpi["closed_count"] = kpi["closed_count"].fillna(0).astype(int)
-
-        # --- BACKLOG END (cumulative created - cumulative closed) ---
-        # We compute backlog per (component, priority_tier) across months
-        kpi = kpi.sort_values(["component", "priority_tier", "month"])
-
-        kpi["backlog_end"] = (
-            kpi.groupby(["component", "priority_tier"], dropna=False)["created_count"].cumsum()
-            - kpi.groupby(["component", "priority_tier"], dropna=False)["closed_count"].cumsum()
+    # --- CLOSED (flow out + resolution stats) ---
+    closed_kpi = (
+        lf.filter(pl.col("closed_at").is_not_null() & pl.col("created_at").is_not_null())
+        .with_columns(
+            pl.col("closed_at").dt.strftime("%Y-%m").alias("month"),
+            res_hours.alias("resolution_hours"),
+        )
+        .group_by(keys)
+        .agg(
+            pl.len().alias("closed_count"),
+            pl.col("resolution_hours").mean().alias("avg_resolution_hours"),
+            pl.col("resolution_hours").median().alias("median_resolution_hours"),
+            pl.col("resolution_hours").quantile(0.9, interpolation="linear").alias("p90_resolution_hours"),
+            *[
+                (pl.col("resolution_hours") <= float(b)).mean().alias(f"share_closed_within_{int(b)}h")
+                for b in buckets
+            ],
+        )
+    )
+
+    # --- MERGE created + closed, then cumulative backlog per (component, tier) ---
+    kpi_lazy = (
+        created_kpi.join(closed_kpi, on=keys, how="full", coalesce=True)
+        .with_columns(
+            pl.col("created_count").fill_null(0).cast(pl.Int64),
+            pl.col("closed_count").fill_null(0).cast(pl.Int64),
+        )
+        .sort(["component", "priority_tier", "month"])
+        .with_columns(
+            (
+                pl.col("created_count").cum_sum().over(["component", "priority_tier"])
+                - pl.col("closed_count").cum_sum().over(["component", "priority_tier"])
+            ).alias("backlog_end")
+        )
+    )
+
+    kpi = kpi_lazy.collect(engine="streaming")
+
+    # --- GLOBAL monthly KPI (weighted by closed_count) ---
+    metrics = [
+        "avg_resolution_hours",
+        "median_resolution_hours",
+        "p90_resolution_hours",
+        *[f"share_closed_within_{int(b)}h" for b in buckets],
+    ]
+    global_kpi = (
+        kpi.group_by("month")
+        .agg(
+            pl.col("created_count").sum(),
+            pl.col("closed_count").sum(),
+            pl.col("backlog_end").sum(),
+            *[
+                ((pl.col(m) * pl.col("closed_count")).sum() / pl.col("closed_count").sum()).alias(m)
+                for m in metrics
+            ],
         )
+        .sort("month")
+    )
+
+    # Convert to pandas only at the very end (shared writers + CSV outputs)
+    _save_outputs(kpi.to_pandas(), global_kpi.to_pandas(), gold_dir, emit_csv)
+
+
+# The only silver columns gold actually reads; everything else (title, body,
+# labels, ...) stays on disk thanks to Parquet projection push-down
+_GOLD_COLUMNS = [
+    "issue_id",
+    "created_at",
+    "closed_at",
+    "updated_at",
+    "ticket_kind",
+    "component",
+    "priority_tier",
+    "resolution_hours",
+]
+
+
+def _run_gold_repo_pandas(owner: str, repo: str, silver_dir: Path, gold_dir: Path, buckets: list, emit_csv: bool = False) -> None:
+    silver_parquet = silver_dir / "issues_silver.parquet"
+    silver_csv = silver_dir / "issues_silver.csv"
+
+    if silver_parquet.exists():
+        available = pq.ParquetFile(silver_parquet).schema_arrow.names
+        df = pd.read_parquet(silver_parquet, columns=[c for c in _GOLD_COLUMNS if c in available])
+    elif silver_csv.exists():
+        df = pd.read_csv(silver_csv, usecols=lambda c: c in _GOLD_COLUMNS)
+    else:
+        raise FileNotFoundError(f"No silver file found in {silver_dir}")
+
+    df = _ensure_datetime(df, ["created_at", "closed_at", "updated_at"])
+
+    # Group keys as category: groupbys/merges hash int codes instead of Python strings
+    for c in ("component", "priority_tier", "ticket_kind", "severity"):
+        if c in df.columns:
+            df[c] = df[c].astype("category")
+
+    # Focus: defect-like tickets only (adapté GitHub)
+    # No .copy(): we only read from the selections and add derived columns via .assign
+    df_def = df[df["ticket_kind"] == "defect"]
+
+    if df_def.empty:
+        print(f"[gold] No defect tickets found for {owner}/{repo}.")
+        return
+
+    # The two branches below share df_def; each materializes only the columns
+    # it aggregates (no more full-frame copies of the defect rows)
+    m_created = df_def["created_at"].notna()
+    m_closed = df_def["closed_at"].notna() & m_created
+
+    # --- CREATED (flow in) ---
+    created = df_def.loc[m_created, ["issue_id", "component", "priority_tier", "created_at"]]
+
+    # Kept on its MultiIndex: the created/closed combination below aligns on it
+    created_kpi = created.groupby(
+        [_month_key(created["created_at"]).rename("month"), created["component"], created["priority_tier"]],
+        dropna=False, sort=False, observed=True,
+    ).agg(created_count=("issue_id", "count"))
+
+    # --- CLOSED (flow out + resolution stats) ---
+    closed_cols = ["issue_id", "component", "priority_tier", "created_at", "closed_at"]
+    if "resolution_hours" in df_def.columns:
+        closed_cols.append("resolution_hours")
+    closed = df_def.loc[m_closed, closed_cols]
+
+    # resolution_hours: si déjà calculé en Silver, on le garde ; sinon on le calcule
+    if "resolution_hours" not in closed.columns or closed["resolution_hours"].isna().all():
+        res_hours = (closed["closed_at"] - closed["created_at"]).dt.total_seconds() / 3600.0
+    else:
+        # au cas où c'est string
+        res_hours = pd.to_numeric(closed["resolution_hours"], errors="coerce")
+    # float32 halves the bytes moved by the groupby aggregation kernels,
+    # and is plenty of precision for durations in hours
+    res_hours = res_hours.astype("float32")
+
+    # Month + buckets (share closed within X hours) derived in one assign
+    share_cols = [f"share_closed_within_{int(b)}h" for b in buckets]
+    derived = {"month": _month_key(closed["closed_at"]), "resolution_hours": res_hours}
+    for b in buckets:
+        derived[f"share_closed_within_{int(b)}h"] = res_hours <= float(b)
+    closed = closed.assign(**derived)
+
+    closed_gb = closed.groupby(["month", "component", "priority_tier"], dropna=False, sort=False, observed=True)
+
+    # median + p90 from one batched quantile call (single sort per group),
+    # instead of a "median" agg plus a per-group Python p90 function
+    quants = closed_gb["resolution_hours"].quantile([0.5, 0.9]).unstack()
+    quants.columns = ["median_resolution_hours", "p90_resolution_hours"]
+
+    closed_kpi = closed_gb.agg(
+        closed_count=("issue_id", "count"),
+        avg_resolution_hours=("resolution_hours", "mean"),
+        **{c: (c, "mean") for c in share_cols},
+    )
+    closed_kpi = pd.concat([closed_kpi, quants], axis=1)[
+        ["closed_count", "avg_resolution_hours", "median_resolution_hours", "p90_resolution_hours", *share_cols]
+    ]
+
+    # --- MERGE created + closed into one monthly table ---
+    # Both frames share the same (month, component, tier) MultiIndex, so a
+    # horizontal concat aligns them without a hash join
+    kpi = pd.concat([created_kpi, closed_kpi], axis=1).reset_index()
+
+    # Fill counts with 0 (int32 is ample for monthly counts)
+    kpi["created_count"] = kpi["created_count"].fillna(0).astype("int32")
+    kpi["closed_count"] = kpi["closed_count"].fillna(0).astype("int32")
+
+    # --- BACKLOG END (cumulative created - cumulative closed) ---
+    # We compute backlog per (component, priority_tier) across months
+    kpi = kpi.sort_values(["component", "priority_tier", "month"])
+
+    # One grouped cumsum over both count columns (single hashing pass)
+    cs = kpi.groupby(["component", "priority_tier"], dropna=False, sort=False, observed=True)[
+        ["created_count", "closed_count"]
+    ].cumsum()
+    kpi["backlog_end"] = cs["created_count"] - cs["closed_count"]
+
+    # --- GLOBAL monthly KPI (all components, weighted) ---
+    global_kpi = kpi.groupby("month", dropna=False, sort=False, observed=True).agg(
+        created_count=("created_count", "sum"),
+        closed_count=("closed_count", "sum"),
+        backlog_end=("backlog_end", "sum"),
+    )
+
+    # Weighted averages for resolution metrics (weighted by closed_count)
+    # We compute them from closed_kpi, because those metrics exist only when closed_count > 0
+    # Vectorized: sum(metric * w) / sum(w) per month, all in one C-level groupby
+    metrics = [
+        "avg_resolution_hours",
+        "median_resolution_hours",
+        "p90_resolution_hours",
+        *[f"share_closed_within_{int(b)}h" for b in buckets],
+    ]
+    w = closed_kpi["closed_count"]
+    ck = pd.DataFrame({f"_num_{m}": closed_kpi[m] * w for m in metrics}).assign(w=w)
+
+    global_res = ck.groupby(level="month", sort=False, observed=True).sum()
+
+    for m in metrics:
+        global_res[m] = global_res[f"_num_{m}"] / global_res["w"].where(global_res["w"] != 0)
+    global_res = global_res[metrics]
+
+    # Both sides are indexed by month: align with concat instead of a merge
+    global_kpi = pd.concat([global_kpi, global_res], axis=1).reset_index()
+    global_kpi = global_kpi.sort_values("month")
+
+    # Render the int month key as "YYYY-MM" only now, for the saved outputs
+    kpi["month"] = _format_month(kpi["month"])
+    global_kpi["month"] = _format_month(global_kpi["month"])
+
+    _save_outputs(kpi, global_kpi, gold_dir, emit_csv)
+
+
+def _process_repo(r: dict, data_dir: Path, buckets: list, emit_csv: bool) -> None:
+    owner, repo = r["owner"], r["repo"]
+
+    silver_dir = data_dir / "silver" / f"{owner}__{repo}"
+    gold_dir = data_dir / "gold" / f"{owner}__{repo}"
+    gold_dir.mkdir(parents=True, exist_ok=True)
+
+    silver_parquet = silver_dir / "issues_silver.parquet"
+
+    if pl is not None and silver_parquet.exists():
+        _run_gold_repo_polars(owner, repo, silver_parquet, gold_dir, buckets, emit_csv)
+    else:
+        _run_gold_repo_pandas(owner, repo, silver_dir, gold_dir, buckets, emit_csv)
+
+
+def run_gold(config_path: str = "config.yml") -> None:
+    load_dotenv()
+    data_dir = Path(os.getenv("DATA_DIR", "./data")).resolve()
+
+    with open(config_path, "r", encoding="utf-8") as f:
+        cfg = yaml.load(f, Loader=_YAML_LOADER)
+
+    repos = cfg["source"]["repos"]
+    rules = cfg.get("rules", {})
+
+    # Buckets (stats de temps)
+    buckets = rules.get("time_buckets_hours", [24, 72, 168, 336])
+
+    emit_csv = cfg.get("outputs", {}).get("emit_csv", False)
+
+    worker = partial(_process_repo, data_dir=data_dir, buckets=buckets, emit_csv=emit_csv)
 
-        # --- GLOBAL monthly KPI (all components, weighted) ---
-        global_kpi = kpi.groupby("month", dropna=False).agg(
-            created_count=("created_count", "sum"),
-            closed_count=("closed_count", "sum"),
-            backlog_end=("backlog_end", "sum"),
-        ).reset_index()
-
-        # Weighted averages for resolution metrics (weighted by closed_count)
-        # We compute them from closed_kpi, because those metrics exist only when closed_count > 0
-        ck = closed_kpi.copy()
-        ck["w"] = ck["closed_count"]
-
-        def weighted_avg(df_, col):
-            num = (df_[col] * df_["w"]).sum()
-            den = df_["w"].sum()
-            return num / den if den else None
-
-        global_res = ck.groupby("month").apply(
-            lambda g: pd.Series({
-                "avg_resolution_hours": weighted_avg(g, "avg_resolution_hours"),
-                "median_resolution_hours": weighted_avg(g, "median_resolution_hours"),
-                "p90_resolution_hours": weighted_avg(g, "p90_resolution_hours"),
-                **{f"share_closed_within_{int(b)}h": weighted_avg(g, f"share_closed_within_{int(b)}h") for b in buckets},
-            })
-        ).reset_index()
-
-        global_kpi = global_kpi.merge(global_res, on="month", how="left")
-
-        # --- SAVE outputs (CSV + Parquet) ---
-        out_comp_csv = gold_dir / "kpi_monthly_component_tier.csv"
-        out_comp_parquet = gold_dir / "kpi_monthly_component_tier.parquet"
-        out_global_csv = gold_dir / "kpi_monthly_global.csv"
-        out_global_parquet = gold_dir / "kpi_monthly_global.parquet"
-
-        kpi.to_csv(out_comp_csv, index=False, encoding="utf-8")
-        kpi.to_parquet(out_comp_parquet, index=False)
-        global_kpi.to_csv(out_global_csv, index=False, encoding="utf-8")
-        global_kpi.to_parquet(out_global_parquet, index=False)
-
-        print(f"[gold] saved -> {out_comp_parquet}")
-        print(f"[gold] saved -> {out_global_parquet}")
-        print(f"[gold] months={global_kpi['month'].nunique()} | created={int(global_kpi['created_count'].sum())} | closed={int(global_kpi['closed_count'].sum())}")
+    # Each repo is fully independent (own silver input, own gold dir):
+    # fan out across processes when there is more than one
+    if len(repos) <= 1:
+        for r in repos:
+            worker(r)
+    else:
+        with ProcessPoolExecutor(max_workers=min(len(repos), os.cpu_count() or 1)) as ex:
+            list(ex.map(worker, repos))
@@ -1,11 +1,139 @@
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from datetime import datetime, timezone
 
 import requests
 import yaml
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # fall back to stdlib json if orjson is not installed
+    orjson = None
+
+
+# libyaml-backed loader when available (3-5x faster than the pure-Python one)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _make_session() -> requests.Session:
+    """Session with keep-alive pool sizing and automatic retries.
+
+    GitHub rate-limit responses (429) are retried honoring Retry-After,
+    and transient 5xx get jittered backoff instead of raising."""
+    session = requests.Session()
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry))
+    return session
+
+
+def _ingest_repo(
+    r: dict,
+    headers: dict,
+    data_dir: Path,
+    run_id: str,
+    per_page: int,
+    since: str | None,
+    created_from_iso: str | None,
+) -> int:
+    """Download all issues for one repo into its bronze JSONL file.
+
+    Runs in its own thread when several repos are configured; each call
+    owns its requests.Session (sessions are not thread-safe).
+    """
+    owner = r["owner"]
+    repo = r["repo"]
+
+    # Output path: data/bronze/<owner>__<repo>/issues_<run_id>.jsonl
+    out_dir = data_dir / "bronze" / f"{owner}__{repo}"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_file = out_dir / f"issues_{run_id}.jsonl"
+
+    print(f"[ingest] repo={owner}/{repo} -> {out_file}")
+    if created_from_iso:
+        print(f"[ingest] created_from={created_from_iso[:10]} (UTC)")
+    if since:
+        print(f"[ingest] full_since(updated)={since}")
+
+    saved_for_repo = 0
+    session = _make_session()
+
+    base_url = f"https://api.github.com/repos/{owner}/{repo}/issues"
+
+    # First request uses params
+    params = {"state": "all", "per_page": per_page}
+    if since:
+        params["since"] = since  # GitHub filters by UPDATED time
+
+    next_url = base_url
+    first = True
+
+    # 1 MiB buffer: pages are ~100 issues, so writes hit the kernel in large
+    # coalesced blocks instead of the 8 KiB default
+    with open(out_file, "wb", buffering=1 << 20) as f_out:
+        while next_url:
+            if first:
+                resp = session.get(next_url, headers=headers, params=params, timeout=60)
+                first = False
+            else:
+                # next_url already contains cursor info in the URL
+                resp = session.get(next_url, headers=headers, timeout=60)
+
+            if resp.status_code == 422:
+                # Show the message and stop cleanly
+                print("[ingest] 422 body:", resp.text)
+                break
+
+            resp.raise_for_status()
+            # Parse the raw body with orjson (C-level) instead of resp.json()
+            items = _loads(resp.content)
+            if not items:
+                break
+
+            # IMPORTANT: Issues endpoint can return pull requests -> exclude them
+            issues_only = [it for it in items if "pull_request" not in it]
+
+            # Optional local filter by CREATED time (skipped entirely when unset).
+            # GitHub timestamps are fixed-format "YYYY-MM-DDTHH:MM:SSZ", which
+            # sorts lexicographically: a plain string compare replaces datetime
+            # parsing per kept issue.
+            if created_from_iso is None:
+                kept = issues_only
+            else:
+                kept = [it for it in issues_only if it["created_at"] >= created_from_iso]
+
+            if kept:
+                # One write per page instead of one per issue
+                f_out.write(b"\n".join(_dumps(it) for it in kept) + b"\n")
+                saved_for_repo += len(kept)
+
+            # Cursor-based pagination: follow Link header "next"
+            next_url = resp.links.get("next", {}).get("url")
+
+    print(f"[ingest] repo={owner}/{repo} saved={saved_for_repo} issues (PRs excluded)")
+    return saved_for_repo
 
 
 def run_ingest(config_path: str = "config.yml") -> None:
@@ -18,6 +146,8 @@ def run_ingest(config_path: str = "config.yml") -> None:
     IMPORTANT:
     - GitHub may refuse page-based pagination for large datasets (page=...).
       So we use cursor-based pagination by following the Link header (resp.links["next"]["url"]).
+      That makes pagination sequential *within* a repo, but repos are
+      independent, so they are fetched in parallel (one thread per repo).
     - Optional filters:
         * ingestion.full_since -> filters by UPDATED time (GitHub "since" parameter)
         * source.created_from -> local filter by CREATED time (created_at)
@@ -30,7 +160,7 @@ def run_ingest(config_path: str = "config.yml") -> None:
 
     # 2) Load config.yml
     with open(config_path, "r", encoding="utf-8") as f:
-        cfg = yaml.safe_load(f) or {}
+        cfg = yaml.load(f, Loader=_YAML_LOADER) or {}
 
     # Repos list
     repos = cfg.get("source", {}).get("repos", [])
@@ -39,10 +169,11 @@ def run_ingest(config_path: str = "config.yml") -> None:
 
     # Optional: filter by created_at (LOCAL filter)
     created_from = cfg.get("source", {}).get("created_from")  # "YYYY-MM-DD"
-    created_from_dt = None
+    created_from_iso = None
     if created_from:
-        # interpret as UTC midnight
+        # interpret as UTC midnight; normalized to the exact GitHub timestamp format
         created_from_dt = datetime.fromisoformat(created_from).replace(tzinfo=timezone.utc)
+        created_from_iso = created_from_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
 
     # Ingestion settings
     per_page = int(cfg.get("ingestion", {}).get("per_page", 100))
@@ -59,72 +190,21 @@ def run_ingest(config_path: str = "config.yml") -> None:
     # 4) Run id: used in output filename/folder
     run_id = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
 
-    total_saved = 0
-    session = requests.Session()
-
-    for r in repos:
-        owner = r["owner"]
-        repo = r["repo"]
-
-        # Output path: data/bronze/<owner>__<repo>/issues_<run_id>.jsonl
-        out_dir = data_dir / "bronze" / f"{owner}__{repo}"
-        out_dir.mkdir(parents=True, exist_ok=True)
-        out_file = out_dir / f"issues_{run_id}.jsonl"
-
-        print(f"[ingest] repo={owner}/{repo} -> {out_file}")
-        if created_from_dt:
-            print(f"[ingest] created_from={created_from_dt.date().isoformat()} (UTC)")
-        if since:
-            print(f"[ingest] full_since(updated)={since}")
-
-        saved_for_repo = 0
-
-        base_url = f"https://api.github.com/repos/{owner}/{repo}/issues"
-
-        # First request uses params
-        params = {"state": "all", "per_page": per_page}
-        if since:
-            params["since"] = since  # GitHub filters by UPDATED time
-
-        next_url = base_url
-        first = True
-
-        with open(out_file, "w", encoding="utf-8") as f_out:
-            while next_url:
-                if first:
-                    resp = session.get(next_url, headers=headers, params=params, timeout=60)
-                    first = False
-                else:
-                    # next_url already contains cursor info in the URL
-                    resp = session.get(next_url, headers=headers, timeout=60)
-
-                if resp.status_code == 422:
-                    # Show the message and stop cleanly
-                    print("[ingest] 422 body:", resp.text)
-                    break
-
-                resp.raise_for_status()
-                items = resp.json()
-                if not items:
-                    break
-
-                # IMPORTANT: Issues endpoint can return pull requests -> exclude them
-                issues_only = [it for it in items if "pull_request" not in it]
-
-                for it in issues_only:
-                    # Optional local filter by CREATED time
-                    if created_from_dt:
-                        created_at = datetime.fromisoformat(it["created_at"].replace("Z", "+00:00"))
-                        if created_at < created_from_dt:
-                            continue
-
-                    f_out.write(json.dumps(it, ensure_ascii=False) + "\n")
-                    saved_for_repo += 1
-
-                # Cursor-based pagination: follow Link header "next"
-                next_url = resp.links.get("next", {}).get("url")
-
-        print(f"[ingest] saved={saved_for_repo} issues (PRs excluded)")
-        total_saved += saved_for_repo
+    worker = partial(
+        _ingest_repo,
+        headers=headers,
+        data_dir=data_dir,
+        run_id=run_id,
+        per_page=per_page,
+        since=since,
+        created_from_iso=created_from_iso,
+    )
+
+    # Ingest is network-bound: overlap the per-repo round-trips with threads
+    if len(repos) <= 1:
+        total_saved = sum(worker(r) for r in repos)
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(repos), 8)) as ex:
+            total_saved = sum(ex.map(worker, repos))
 
     print(f"[ingest] DONE. total_saved={total_saved}")
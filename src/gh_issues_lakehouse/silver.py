@@ -1,30 +1,286 @@
 import os
 import json
-from pathlib import Path
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import requests
 import yaml
 from dotenv import load_dotenv
+from pyarrow import csv as pacsv
+from pyarrow import json as pajson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # fall back to stdlib json if orjson is not installed
+    orjson = None
+
+
+# libyaml-backed loader when available (3-5x faster than the pure-Python one)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@dataclass(frozen=True)
+class SilverRules:
+    """Label-classification rule sets, normalized once from config.yml.
+
+    All groups are frozensets (prefixes a lowered tuple) so the classifiers
+    and the catalog share one immutable, picklable bundle instead of each
+    call site re-deriving sets from the raw config dicts.
+    """
+
+    kind_sets: dict
+    p0_set: frozenset
+    p1_set: frozenset
+    p2_fallback_if_bug: bool
+    prefixes: tuple
+    allowlist: frozenset
+    process_set: frozenset
+    meta_labels: frozenset
+    family_map: dict
+
+    @classmethod
+    def from_config(cls, rules: dict) -> "SilverRules":
+        kind_labels = rules.get("kind_labels", {})
+        process_set = frozenset(rules.get("process_labels", []))
+        priority_cfg = rules.get("priority_tiers", {})
+        component_cfg = rules.get("component", {})
+
+        kind_sets = {key: frozenset(kind_labels.get(key, [])) for key in ("bug", "docs", "enhancement", "question")}
+        p0_set = frozenset(priority_cfg.get("P0", []))
+        p1_set = frozenset(priority_cfg.get("P1", []))
+        allowlist = frozenset(component_cfg.get("allowlist", []))
+
+        # Labels that should NOT become components
+        meta_labels = frozenset().union(process_set, p0_set, p1_set, *kind_labels.values())
+
+        # {label: family} for the catalog; later updates win, so insert
+        # lowest-priority families first (component < process < priority < kind)
+        family_map = {}
+        family_map.update({l: "component" for l in allowlist})
+        family_map.update({l: "process" for l in process_set})
+        family_map.update({l: "priority" for l in p0_set | p1_set})
+        for v in kind_labels.values():
+            family_map.update({l: "kind" for l in v})
+
+        return cls(
+            kind_sets=kind_sets,
+            p0_set=p0_set,
+            p1_set=p1_set,
+            p2_fallback_if_bug=priority_cfg.get("P2_fallback_if_bug", True),
+            prefixes=tuple(p.lower().strip() for p in component_cfg.get("prefixes", [])),
+            allowlist=allowlist,
+            process_set=process_set,
+            meta_labels=meta_labels,
+            family_map=family_map,
+        )
+
+
+def _loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Only the fields silver actually uses; everything else in the payload is skipped
+_BRONZE_SCHEMA = pa.schema(
+    [
+        ("id", pa.int64()),
+        ("number", pa.int64()),
+        ("state", pa.string()),
+        ("title", pa.string()),
+        ("body", pa.string()),
+        ("created_at", pa.string()),
+        ("updated_at", pa.string()),
+        ("closed_at", pa.string()),
+        ("labels", pa.list_(pa.struct([("name", pa.string())]))),
+    ]
+)
+
+_BRONZE_COLUMNS = ["id", "number", "state", "title", "body", "created_at", "updated_at", "closed_at"]
+
+
+def _read_bronze_arrow(bronze_file: Path) -> pa.Table:
+    """Parse the bronze JSONL in C++ with block-parallelism, straight to columns."""
+    tbl = pajson.read_json(
+        str(bronze_file),
+        parse_options=pajson.ParseOptions(explicit_schema=_BRONZE_SCHEMA, unexpected_field_behavior="ignore"),
+    )
+    # Flatten list<struct<name>> into list<string>, keeping per-issue offsets
+    labels = tbl.column("labels").combine_chunks()
+    names = pa.ListArray.from_arrays(labels.offsets, labels.values.field("name"))
+    return tbl.drop_columns("labels").append_column("labels", names)
+
+
+_CHUNK_ROWS = 50_000
+
+
+def _read_bronze_python(bronze_file: Path) -> pa.Table:
+    """Line-by-line fallback for files Arrow rejects (e.g. schema drift).
+
+    Parsed in chunks of _CHUNK_ROWS: each chunk is flushed into a compact
+    Arrow table so the Python-object working set stays bounded instead of
+    holding every parsed line in memory at once.
+    """
+    tables = []
+    issue_ids = []
+    issue_numbers = []
+    states = []
+    titles = []
+    bodies = []
+    created = []
+    updated = []
+    closed = []
+    labels_lists = []
+    columns = (issue_ids, issue_numbers, states, titles, bodies, created, updated, closed, labels_lists)
+
+    def flush() -> None:
+        tables.append(
+            pa.table(
+                {
+                    "id": pa.array(issue_ids, type=pa.int64()),
+                    "number": pa.array(issue_numbers, type=pa.int64()),
+                    "state": pa.array(states, type=pa.string()),
+                    "title": pa.array(titles, type=pa.string()),
+                    "body": pa.array(bodies, type=pa.string()),
+                    "created_at": pa.array(created, type=pa.string()),
+                    "updated_at": pa.array(updated, type=pa.string()),
+                    "closed_at": pa.array(closed, type=pa.string()),
+                    "labels": pa.array(labels_lists, type=pa.list_(pa.string())),
+                }
+            )
+        )
+        for col in columns:
+            col.clear()
+
+    # Hot references as locals: skips a LOAD_GLOBAL / method lookup per line
+    loads = _loads
+    add_labels = labels_lists.append
+    add_id = issue_ids.append
+    add_number = issue_numbers.append
+    add_state = states.append
+    add_title = titles.append
+    add_body = bodies.append
+    add_created = created.append
+    add_updated = updated.append
+    add_closed = closed.append
+
+    # Binary mode: orjson takes bytes directly, skipping per-line UTF-8 decode
+    with open(bronze_file, "rb") as f_in:
+        for line in f_in:
+            if not line.strip():
+                continue
+            issue = loads(line)
+
+            add_labels([x.get("name") for x in issue.get("labels", []) if x.get("name")])
+            add_id(issue.get("id"))
+            add_number(issue.get("number"))
+            add_state(issue.get("state"))
+            add_title(issue.get("title"))
+            add_body(issue.get("body"))
+            add_created(issue.get("created_at"))
+            add_updated(issue.get("updated_at"))
+            add_closed(issue.get("closed_at"))
+
+            if len(issue_ids) >= _CHUNK_ROWS:
+                flush()
+
+    if issue_ids or not tables:
+        flush()
+    return pa.concat_tables(tables)
+
+
+def _read_bronze(bronze_file: Path) -> pa.Table:
+    try:
+        return _read_bronze_arrow(bronze_file)
+    except pa.ArrowInvalid as exc:
+        print(f"[silver] arrow reader failed ({exc}); falling back to line parser")
+        return _read_bronze_python(bronze_file)
 
 
 def find_latest_bronze_file(data_dir: Path, owner: str, repo: str) -> Path:
     folder = data_dir / "bronze" / f"{owner}__{repo}"
-    files = sorted(folder.glob("issues_*.jsonl"))
-    if not files:
+    # Single O(N) pass over the dir entries; no full listing to sort and no
+    # Path object per historical snapshot
+    latest = None
+    if folder.is_dir():
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.name.startswith("issues_") and entry.name.endswith(".jsonl"):
+                    if latest is None or entry.name > latest:
+                        latest = entry.name
+    if latest is None:
         raise FileNotFoundError(f"No bronze files found in {folder}")
-    return files[-1]
-
-
-def fetch_repo_label_descriptions(owner: str, repo: str, headers: dict, per_page: int = 100) -> dict:
-    """Return {label_name: description} from GitHub labels endpoint."""
+    return folder / latest
+
+
+def _make_session() -> requests.Session:
+    """Keep-alive session with retries for the GitHub labels endpoint.
+
+    One TLS handshake for all pages (and all repos); 429/5xx get backoff
+    instead of failing the run."""
+    session = requests.Session()
+    retry = Retry(total=5, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504), respect_retry_after_header=True)
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    return session
+
+
+# Per-process memo so repos sharing a label set are fetched once per run
+_label_desc_memo: dict = {}
+
+
+def fetch_repo_label_descriptions(
+    owner: str,
+    repo: str,
+    headers: dict,
+    per_page: int = 100,
+    cache_path: Path | None = None,
+    session: requests.Session | None = None,
+) -> dict:
+    """Return {label_name: description} from GitHub labels endpoint.
+
+    Results are cached on disk together with the response ETag, so reruns
+    against an unchanged label set cost a single conditional GET (304)
+    instead of re-paginating the whole endpoint.
+    """
+    memo_key = (owner, repo)
+    if memo_key in _label_desc_memo:
+        return _label_desc_memo[memo_key]
+
+    cached = {}
+    if cache_path is not None and cache_path.exists():
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            cached = {}
+
+    client = session if session is not None else requests
     page = 1
     out = {}
+    etag = None
     while True:
         url = f"https://api.github.com/repos/{owner}/{repo}/labels"
-        r = requests.get(url, headers=headers, params={"per_page": per_page, "page": page}, timeout=60)
+        req_headers = headers
+        if page == 1 and cached.get("etag"):
+            req_headers = dict(headers, **{"If-None-Match": cached["etag"]})
+        r = client.get(url, headers=req_headers, params={"per_page": per_page, "page": page}, timeout=60)
+        if r.status_code == 304:
+            out = cached.get("labels", {})
+            etag = cached.get("etag")
+            break
         r.raise_for_status()
+        if page == 1:
+            etag = r.headers.get("ETag")
         items = r.json()
         if not items:
             break
@@ -35,67 +291,175 @@ def fetch_repo_label_descriptions(owner: str, repo: str, headers: dict, per_page
         if len(items) < per_page:
             break
         page += 1
-    return out
 
+    if cache_path is not None:
+        try:
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump({"etag": etag, "labels": out}, f, ensure_ascii=False)
+        except OSError:
+            pass
 
-def compute_ticket_kind(labels: list[str], kind_labels: dict) -> str:
-    if any(l in labels for l in kind_labels.get("bug", [])):
-        return "defect"
-    if any(l in labels for l in kind_labels.get("docs", [])):
-        return "docs"
-    if any(l in labels for l in kind_labels.get("enhancement", [])):
-        return "enhancement"
-    if any(l in labels for l in kind_labels.get("question", [])):
-        return "question"
-    return "other"
-
-
-def compute_priority_tier(labels: list[str], ticket_kind: str, priority_cfg: dict, kind_labels: dict) -> str:
-    # Only meaningful for defect-like tickets
-    if ticket_kind != "defect":
-        # But still allow explicit P0/P1 even if "Bug" label missing (rare)
-        if any(l in labels for l in priority_cfg.get("P0", [])):
-            return "P0"
-        if any(l in labels for l in priority_cfg.get("P1", [])):
-            return "P1"
-        return "NA"
-
-    if any(l in labels for l in priority_cfg.get("P0", [])):
-        return "P0"
-    if any(l in labels for l in priority_cfg.get("P1", [])):
-        return "P1"
+    _label_desc_memo[memo_key] = out
+    return out
 
-    # Fallback: if Bug and not P0/P1 -> P2
-    if priority_cfg.get("P2_fallback_if_bug", True):
-        bug_labels = set(kind_labels.get("bug", []))
-        if any(l in labels for l in bug_labels):
-            return "P2"
 
-    return "NA"
+def compute_ticket_kind(labels: pd.Series, kind_sets: dict) -> pd.Series:
+    """Vectorized ticket kind over a Series of label lists (first match wins)."""
+    exploded = labels.explode()
+    conds = []
+    choices = []
+    for key, kind in (("bug", "defect"), ("docs", "docs"), ("enhancement", "enhancement"), ("question", "question")):
+        hit = exploded.isin(kind_sets[key]).groupby(level=0).any().reindex(labels.index, fill_value=False)
+        conds.append(hit)
+        choices.append(kind)
+    return pd.Series(np.select(conds, choices, default="other"), index=labels.index)
 
 
-def pick_component(labels: list[str], component_cfg: dict, meta_labels: set[str]) -> str:
-    prefixes = [p.lower().strip() for p in component_cfg.get("prefixes", [])]
-    allowlist = set(component_cfg.get("allowlist", []))
+def compute_priority_tier(
+    labels: pd.Series,
+    ticket_kind: pd.Series,
+    p0_set: frozenset,
+    p1_set: frozenset,
+    bug_set: frozenset,
+    p2_fallback_if_bug: bool = True,
+) -> pd.Series:
+    """Vectorized priority tier over a Series of label lists.
 
-    # 1) prefix rule (if exists)
-    for lab in labels:
-        lab_low = lab.lower().strip()
-        for pref in prefixes:
-            if lab_low.startswith(pref):
-                return lab.split(":", 1)[1].strip() if ":" in lab else "other"
+    Explicit P0/P1 labels always win (even without a bug label); defect-like
+    tickets without an explicit tier fall back to P2 when configured.
+    """
+    exploded = labels.explode()
 
-    # 2) allowlist rule (common for pandas)
-    for lab in labels:
-        if lab in allowlist:
-            return lab
+    def has_any(label_set: frozenset) -> pd.Series:
+        return exploded.isin(label_set).groupby(level=0).any().reindex(labels.index, fill_value=False)
 
-    # 3) fallback: first non-meta label
-    for lab in labels:
-        if lab not in meta_labels:
-            return lab
+    conds = [has_any(p0_set), has_any(p1_set)]
+    choices = ["P0", "P1"]
 
-    return "other"
+    # Fallback: if Bug and not P0/P1 -> P2
+    if p2_fallback_if_bug:
+        conds.append(ticket_kind.eq("defect") & has_any(bug_set))
+        choices.append("P2")
+
+    return pd.Series(np.select(conds, choices, default="NA"), index=labels.index)
+
+
+def pick_component(
+    labels: pd.Series, prefixes: tuple, allowlist: frozenset, meta_labels: frozenset
+) -> pd.Series:
+    """Vectorized component pick over a Series of label lists.
+
+    Rule priority matches the old row-wise scan: 1) prefix rule (value is the
+    part after ":"), 2) allowlist, 3) first non-meta label, else "other".
+    """
+    exploded = labels.explode().dropna()
+    lab_low = exploded.str.lower().str.strip()
+
+    is_prefix = lab_low.str.startswith(prefixes) if prefixes else pd.Series(False, index=exploded.index)
+    is_allow = exploded.isin(allowlist)
+    is_non_meta = ~exploded.isin(meta_labels)
+
+    rank = np.select([is_prefix, is_allow, is_non_meta], [0, 1, 2], default=3)
+    prefix_value = np.where(
+        exploded.str.contains(":", regex=False),
+        exploded.str.partition(":")[2].str.strip(),
+        "other",
+    )
+    cand = pd.DataFrame({"rank": rank, "value": exploded.where(rank != 0, prefix_value)}, index=exploded.index)
+    cand = cand[cand["rank"] < 3]
+
+    # Stable sort keeps label order within each rank, like the row-wise scan did
+    best = cand.sort_values("rank", kind="stable").groupby(level=0)["value"].first()
+    return best.reindex(labels.index, fill_value="other")
+
+
+def _process_repo(
+    r: dict,
+    data_dir: Path,
+    headers: dict,
+    emit_csv: bool,
+    rules: SilverRules,
+    session: requests.Session | None = None,
+) -> None:
+    owner, repo = r["owner"], r["repo"]
+    if session is None:  # parallel workers build their own connection pool
+        session = _make_session()
+
+    bronze_file = find_latest_bronze_file(data_dir, owner, repo)
+    silver_dir = data_dir / "silver" / f"{owner}__{repo}"
+    silver_dir.mkdir(parents=True, exist_ok=True)
+
+    out_csv = silver_dir / "issues_silver.csv"
+    out_parquet = silver_dir / "issues_silver.parquet"
+    out_label_csv = silver_dir / "label_catalog.csv"
+    out_label_parquet = silver_dir / "label_catalog.parquet"
+
+    print(f"[silver] bronze={bronze_file}")
+
+    tbl = _read_bronze(bronze_file)
+
+    # Label frequencies straight from the Arrow column; first-seen order is
+    # preserved so most_common() ties break like the old per-row Counter
+    vc = pc.value_counts(pc.list_flatten(tbl.column("labels")).drop_null())
+    counter = Counter(dict(zip(vc.field("values").to_pylist(), vc.field("counts").to_pylist())))
+
+    df = tbl.select(_BRONZE_COLUMNS).rename_columns(["issue_id", "issue_number", *_BRONZE_COLUMNS[2:]]).to_pandas()
+    labels_s = tbl.column("labels").to_pandas()
+    # One C loop over the list<string> column instead of N Python str.joins
+    df["labels"] = pc.binary_join(tbl.column("labels"), "|").to_pandas().fillna("")
+
+    # Classification is vectorized over the whole frame instead of per row
+    df["ticket_kind"] = compute_ticket_kind(labels_s, rules.kind_sets)
+    df["priority_tier"] = compute_priority_tier(
+        labels_s, df["ticket_kind"], rules.p0_set, rules.p1_set, rules.kind_sets["bug"], rules.p2_fallback_if_bug
+    )
+    df["component"] = pick_component(labels_s, rules.prefixes, rules.allowlist, rules.meta_labels)
+
+    for col in ["created_at", "updated_at", "closed_at"]:
+        df[col] = pd.to_datetime(df[col], utc=True, errors="coerce")
+
+    # Resolution hours for closed issues; NaT - timestamp already yields
+    # NaN, so open issues need no follow-up masking and the column stays float64
+    df["resolution_hours"] = (df["closed_at"] - df["created_at"]).dt.total_seconds() / 3600.0
+
+    # Low-cardinality columns as categoricals: int8 codes in memory and a
+    # single dictionary page per row group in Parquet
+    for col in ("state", "ticket_kind", "priority_tier", "component"):
+        df[col] = df[col].astype("category")
+
+    # Save: Parquet is the contract (zstd compresses the text-heavy
+    # title/body columns much better than snappy); CSV is opt-in
+    if emit_csv:
+        df.to_csv(out_csv, index=False, encoding="utf-8")
+        print(f"[silver] saved -> {out_csv}")
+    df.to_parquet(out_parquet, index=False, compression="zstd", use_dictionary=True, row_group_size=50_000)
+    print(f"[silver] saved -> {out_parquet}")
+    # One grouped count feeds both stat lines (this used to scan the frame
+    # three times); observed=True keeps it on the category codes
+    by_state_tier = df.groupby(["state", "priority_tier"], observed=True).size().unstack(fill_value=0)
+    state_totals = by_state_tier.sum(axis=1)
+    tier_counts = by_state_tier.sum(axis=0).sort_values(ascending=False)
+    print(f"[silver] stats open={state_totals.get('open', 0)} closed={state_totals.get('closed', 0)}")
+    print(f"[silver] tier_counts={tier_counts.to_dict()}")
+
+    # Label catalog (count + description)
+    desc_map = fetch_repo_label_descriptions(
+        owner, repo, headers=headers, per_page=100, cache_path=silver_dir / ".label_cache.json", session=session
+    )
+    # Straight to Arrow: no DataFrame construction or dtype inference needed
+    labels_sorted = counter.most_common()
+    catalog = pa.table(
+        {
+            "label": pa.array([l for l, _ in labels_sorted], type=pa.string()),
+            "count": pa.array([c for _, c in labels_sorted], type=pa.int64()),
+            "description": pa.array([desc_map.get(l, "") for l, _ in labels_sorted], type=pa.string()),
+            "family": pa.array([rules.family_map.get(l, "other") for l, _ in labels_sorted], type=pa.string()),
+        }
+    )
+    if emit_csv:
+        pacsv.write_csv(catalog, out_label_csv)
+    pq.write_table(catalog, out_label_parquet, compression="zstd")
+    print(f"[silver] label_catalog saved -> {out_label_parquet}")
 
 
 def run_silver(config_path: str = "config.yml") -> None:
@@ -104,94 +468,26 @@ def run_silver(config_path: str = "config.yml") -> None:
     data_dir = Path(os.getenv("DATA_DIR", "./data")).resolve()
 
     with open(config_path, "r", encoding="utf-8") as f:
-        cfg = yaml.safe_load(f)
+        cfg = yaml.load(f, Loader=_YAML_LOADER)
 
-    rules = cfg.get("rules", {})
-    kind_labels = rules.get("kind_labels", {})
-    process_labels = set(rules.get("process_labels", []))
-    priority_cfg = rules.get("priority_tiers", {})
-    component_cfg = rules.get("component", {})
+    # Same switch as gold: Parquet is the contract, CSV is for inspection
+    emit_csv = cfg.get("outputs", {}).get("emit_csv", False)
 
-    # Labels that should NOT become components
-    meta_labels = set(process_labels)
-    for _, v in kind_labels.items():
-        meta_labels.update(v)
-    meta_labels.update(priority_cfg.get("P0", []))
-    meta_labels.update(priority_cfg.get("P1", []))
+    rules = SilverRules.from_config(cfg.get("rules", {}))
 
     headers = {"Accept": "application/vnd.github+json", "User-Agent": "gh-issues-lakehouse"}
     if token:
         headers["Authorization"] = f"Bearer {token}"
 
-    for r in cfg["source"]["repos"]:
-        owner, repo = r["owner"], r["repo"]
-
-        bronze_file = find_latest_bronze_file(data_dir, owner, repo)
-        silver_dir = data_dir / "silver" / f"{owner}__{repo}"
-        silver_dir.mkdir(parents=True, exist_ok=True)
-
-        out_csv = silver_dir / "issues_silver.csv"
-        out_parquet = silver_dir / "issues_silver.parquet"
-        out_label_csv = silver_dir / "label_catalog.csv"
-        out_label_parquet = silver_dir / "label_catalog.parquet"
-
-        print(f"[silver] bronze={bronze_file}")
-
-        rows = []
-        counter = Counter()
-
-        with open(bronze_file, "r", encoding="utf-8") as f_in:
-            for line in f_in:
-                line = line.strip()
-                if not line:
-                    continue
-                issue = json.loads(line)
-
-                labels = [x.get("name") for x in issue.get("labels", []) if x.get("name")]
-                for lab in labels:
-                    counter[lab] += 1
-
-                ticket_kind = compute_ticket_kind(labels, kind_labels)
-                priority_tier = compute_priority_tier(labels, ticket_kind, priority_cfg, kind_labels)
-                component = pick_component(labels, component_cfg, meta_labels)
-
-                rows.append({
-                    "issue_id": issue.get("id"),
-                    "issue_number": issue.get("number"),
-                    "state": issue.get("state"),
-                    "title": issue.get("title"),
-                    "body": issue.get("body"),
-                    "created_at": issue.get("created_at"),
-                    "updated_at": issue.get("updated_at"),
-                    "closed_at": issue.get("closed_at"),
-                    "labels": "|".join(labels),
-                    "ticket_kind": ticket_kind,
-                    "priority_tier": priority_tier,
-                    "component": component,
-                })
-
-        df = pd.DataFrame(rows)
-
-        for col in ["created_at", "updated_at", "closed_at"]:
-            df[col] = pd.to_datetime(df[col], utc=True, errors="coerce")
-
-        # Resolution hours for closed issues
-        df["resolution_hours"] = (df["closed_at"] - df["created_at"]).dt.total_seconds() / 3600.0
-        df.loc[df["closed_at"].isna(), "resolution_hours"] = pd.NA
-
-        # Save
-        df.to_csv(out_csv, index=False, encoding="utf-8")
-        df.to_parquet(out_parquet, index=False)
-
-        print(f"[silver] saved -> {out_csv}")
-        print(f"[silver] saved -> {out_parquet}")
-        print(f"[silver] stats open={(df['state']=='open').sum()} closed={(df['state']=='closed').sum()}")
-        print(f"[silver] tier_counts={df['priority_tier'].value_counts(dropna=False).to_dict()}")
-
-        # Label catalog (count + description)
-        desc_map = fetch_repo_label_descriptions(owner, repo, headers=headers, per_page=100)
-        labels_df = pd.DataFrame(counter.most_common(), columns=["label", "count"])
-        labels_df["description"] = labels_df["label"].map(desc_map).fillna("")
-        labels_df.to_csv(out_label_csv, index=False, encoding="utf-8")
-        labels_df.to_parquet(out_label_parquet, index=False)
-        print(f"[silver] label_catalog saved -> {out_label_csv}")
+    repos = cfg["source"]["repos"]
+    worker = partial(_process_repo, data_dir=data_dir, headers=headers, emit_csv=emit_csv, rules=rules)
+
+    # Each repo is fully independent (own bronze file, own silver dir):
+    # fan out across processes when there is more than one
+    if len(repos) <= 1:
+        session = _make_session()
+        for r in repos:
+            worker(r, session=session)
+    else:
+        with ProcessPoolExecutor(max_workers=min(len(repos), os.cpu_count() or 1)) as ex:
+            list(ex.map(worker, repos))